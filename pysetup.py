@@ -1,4 +1,5 @@
 import os
+import functools
 import subprocess
 import sys
 import site
@@ -11,9 +12,22 @@ import json
 import threading
 import time
 import re
+import string
+import textwrap
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
 
 VENV = ".venv"
 
+# The venv's bundled pip is only upgraded when it is older than this
+MIN_PIP_VERSION = (24, 0)
+
 
 def _detect_python_command() -> str:
     """Detect the available python command (python3 or python).
@@ -133,6 +147,134 @@ def _get_python_version_from_path(python_path: str) -> str:
     return ""
 
 
+# Returned by _read_pyproject when pyproject.toml exists but can't be read
+_PYPROJECT_UNREADABLE = object()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_pyproject():
+    """Read pyproject.toml once per process.
+    
+    Callers that write pyproject.toml must call ``_read_pyproject.cache_clear()``
+    afterwards so later reads see the new content.
+    
+    Returns:
+        str: The file contents, None if pyproject.toml does not exist, or
+             _PYPROJECT_UNREADABLE if it exists but can't be read or decoded
+    """
+    try:
+        return Path("pyproject.toml").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError):
+        return _PYPROJECT_UNREADABLE
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_pyproject():
+    """Parse pyproject.toml once per process.
+    
+    Must be cleared together with ``_read_pyproject`` after pyproject.toml is
+    written.
+    
+    Returns:
+        dict: The parsed document, or None if the file is missing, unreadable,
+              is not valid TOML, or no TOML parser (tomllib/tomli) is available
+    """
+    contents = _read_pyproject()
+    if contents is None or contents is _PYPROJECT_UNREADABLE or tomllib is None:
+        return None
+    try:
+        return tomllib.loads(contents)
+    except tomllib.TOMLDecodeError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _git_config_all() -> dict:
+    """Read the effective git configuration with a single ``git config`` call.
+    
+    Returns:
+        dict: Mapping of config keys (e.g. 'user.name') to values; empty if git
+              is unavailable or the call fails
+    """
+    try:
+        result = subprocess.run(
+            ["git", "config", "--list", "--null"], capture_output=True, text=True
+        )
+    except Exception:
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    config = {}
+    # Each entry is "key\nvalue" terminated by NUL; later entries win, as with --get
+    for entry in result.stdout.split("\0"):
+        if entry:
+            key, _, value = entry.partition("\n")
+            config[key] = value
+    return config
+
+
+def _create_venv(python_path: str, venv_path: str = VENV):
+    """Create a virtual environment for the given python executable.
+    
+    When python_path is the interpreter running this script and that
+    interpreter is not itself inside a venv, the venv is built in-process with
+    ``venv.EnvBuilder`` to avoid starting another interpreter. Otherwise (or if
+    the in-process build fails) it falls back to ``python -m venv``.
+    
+    Args:
+        python_path: Path to the python executable the venv should use
+        venv_path: Path of the virtual environment to create
+        
+    Raises:
+        subprocess.CalledProcessError: If the ``python -m venv`` fallback fails
+    """
+    # From inside a venv, EnvBuilder may base the new venv on the outer venv's
+    # python (e.g. Python < 3.11), so only build in-process from a base install
+    running_in_venv = sys.prefix != getattr(sys, "base_prefix", sys.prefix)
+    if not running_in_venv and os.path.realpath(python_path) == os.path.realpath(sys.executable):
+        try:
+            import venv
+            venv.EnvBuilder(with_pip=True, symlinks=(os.name != "nt")).create(venv_path)
+            return
+        except Exception as e:
+            print_info(f"In-process venv creation failed ({e}), retrying with {python_path} -m venv")
+    subprocess.run([python_path, "-m", "venv", venv_path], check=True)
+
+
+def _get_venv_pip_version(venv_path: str = VENV) -> tuple:
+    """Get the version of pip installed in a virtual environment.
+    
+    Reads the version from pip's dist-info directory name instead of running
+    ``pip --version``, so no subprocess is needed.
+    
+    Args:
+        venv_path: Path to the virtual environment
+        
+    Returns:
+        tuple: Version tuple like (24, 0) or None if pip is not found
+    """
+    for dist_info in Path(venv_path).glob("lib/python3*/site-packages/pip-*.dist-info"):
+        match = re.match(r'pip-(\d+)\.(\d+)', dist_info.name)
+        if match:
+            return (int(match.group(1)), int(match.group(2)))
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _python_version() -> str:
+    """Version of the interpreter running this script, computed once."""
+    return platform.python_version()
+
+
+@functools.lru_cache(maxsize=1)
+def _site_packages_path() -> str:
+    """First site-packages directory of the running interpreter, computed once."""
+    return site.getsitepackages()[0] if hasattr(site, "getsitepackages") else "N/A"
+
+
 def _detect_pip_command(venv_path: str = VENV) -> str:
     """Detect the available pip command inside the virtual environment.
     
@@ -172,21 +314,35 @@ RED = "\033[91m"
 GREEN = "\033[92m"
 RESET = "\033[0m"
 
+# Pre-built message templates so each print_* call is one format + one write
+_SUCCESS_FMT = f"{GREEN}✅ {{}}{RESET}\n".format
+_ERROR_FMT = f"{RED}❌ {{}}{RESET}\n".format
+_INFO_FMT = "👉 {}\n".format
+_WARNING_FMT = "⚠️  {}\n".format
+_HEADER_FMT = f"\n🔎 {{}}\n{'=' * 30}\n".format
+
+# Whitespace surrounding one or more line breaks, used by _strip_content
+_LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+
 
 def print_success(msg):
-    print(f"{GREEN}✅ {msg}{RESET}")
+    sys.stdout.write(_SUCCESS_FMT(msg))
 
 
 def print_error(msg):
-    print(f"{RED}❌ {msg}{RESET}")
+    sys.stdout.write(_ERROR_FMT(msg))
 
 
 def print_info(msg):
-    print(f"👉 {msg}")
+    sys.stdout.write(_INFO_FMT(msg))
+
+
+def print_warning(msg):
+    sys.stdout.write(_WARNING_FMT(msg))
 
 
 def print_header(msg):
-    print(f"\n🔎 {msg}\n{'=' * 30}")
+    sys.stdout.write(_HEADER_FMT(msg))
 
 
 def _remove_directory(path, retries=3, retry_delay=0.5):
@@ -235,10 +391,12 @@ def _remove_directory(path, retries=3, retry_delay=0.5):
     # Final attempt: Use platform-specific commands
     try:
         print_info("Attempting platform-specific directory removal...")
+        # Pass an argv list rather than a command string so no extra shell is
+        # spawned (rd is a cmd builtin, so Windows still needs cmd itself)
         if platform.system() == "Windows":
-            os.system(f'rd /s /q "{path}"')
+            subprocess.run(["cmd", "/c", "rd", "/s", "/q", str(path)])
         else:  # Unix-like systems (macOS, Linux)
-            os.system(f'rm -rf "{path}"')
+            subprocess.run(["rm", "-rf", str(path)])
         
         # Check if directory was actually removed
         if not path.exists():
@@ -251,6 +409,70 @@ def _remove_directory(path, retries=3, retry_delay=0.5):
     return False
 
 
+# Characters that aren't valid in a package name, mapped to underscores
+_PACKAGE_NAME_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+# pyproject.toml templates, filled in by ProjectSetup._create_pyproject_toml
+_POETRY_PYPROJECT_TEMPLATE = string.Template(textwrap.dedent("""\
+    [tool.poetry]
+    name = "$name"
+    version = "$version"
+    description = "$description"
+    authors = ["$author_name <$author_email>"]
+
+    [tool.poetry.dependencies]
+    python = "^3.8"$dependencies
+
+    [tool.poetry.group.dev.dependencies]
+    pytest = "^7.0"
+
+    [build-system]
+    requires = ["poetry-core>=1.0.0"]
+    build-backend = "poetry.core.masonry.api"
+"""))
+
+_PROJECT_PYPROJECT_TEMPLATE = string.Template(textwrap.dedent("""\
+    [project]
+    name = "$name"
+    version = "$version"
+    description = "$description"
+    authors = [{name="$author_name", email="$author_email"}]
+    requires-python = ">=3.8"
+
+    [tool.pytest.ini_options]
+    pythonpath = ["src"]
+    testpaths = ["tests", "src"]
+    markers = [
+        "integration: marks tests as integration (deselect with '-m \\"not integration\\"')"
+    ]
+    addopts = "-m 'not integration'"
+
+    [build-system]
+    requires = ["$build_system"]
+    build-backend = "$build_system.build"
+
+    [tool.hatch.build.targets.wheel]
+    packages = ["src/$name"]
+
+    [tool.hatch.build.targets.sdist]
+    exclude = [
+        ".unittest/",
+        ".venv/",
+        "tests/",
+        "samples/",
+        "docs/",
+        ".git/",
+        ".gitignore",
+        ".vscode/",
+        "*.pyc",
+        "__pycache__/",
+        "*.egg-info/",
+        "dist/",
+        "build/"
+    ]
+"""))
+
+
 class ProjectSetup:
     CA_CONFIG = Path(".pysetup.json")
     
@@ -283,6 +505,8 @@ class ProjectSetup:
     def __init__(self):
         self._use_poetry: bool = False
         self._package_name: str = ""
+        self._os_type: str = ""
+        self._requirements_files: List[str] = None
         self.__exit_notes: List[str] = []
 
         # Default settings with Python paths and repositories
@@ -1398,13 +1622,17 @@ class ProjectSetup:
         Returns:
             str: The requires-python constraint (e.g., '>=3.10') or empty string
         """
-        pyproject_path = Path("pyproject.toml")
-        if not pyproject_path.exists():
-            return ""
-        
         try:
-            with open(pyproject_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = _read_pyproject()
+            if content is None or content is _PYPROJECT_UNREADABLE:
+                return ""
+            
+            data = _parse_pyproject()
+            if data is not None:
+                project = data.get("project")
+                requires_python = project.get("requires-python") if isinstance(project, dict) else None
+                # Only a quoted string is a usable constraint (e.g. not `= 3.10`)
+                return requires_python if isinstance(requires_python, str) else ""
             
             # Look for requires-python in [project] section
             match = re.search(r'requires-python\s*=\s*"([^"]*)"', content)
@@ -1454,8 +1682,11 @@ class ProjectSetup:
         return warnings
 
     def _detect_platform(self):
-        sysname = os.uname().sysname
-        arch = os.uname().machine
+        if self._os_type:
+            return self._os_type
+
+        uname = platform.uname()
+        sysname, arch = uname.system, uname.machine
         print("🧠 Detecting OS and architecture...")
 
         os_type = "unknown"
@@ -1503,43 +1734,49 @@ class ProjectSetup:
                 )
                 self._use_poetry = pip_or_poetry.lower() == "poetry"
         
+        self._os_type = os_type
         return os_type
 
     def _detect_project_tool(self):
-        if not os.path.exists("pyproject.toml"):
-
-            if os.path.exists("requirements.txt"):
-                return "pip"
-            else:
+        try:
+            contents = _read_pyproject()
+            data = _parse_pyproject()
 
+            if contents is _PYPROJECT_UNREADABLE:
                 return None
-        try:
-            with open("pyproject.toml", "r", encoding="utf-8") as f:
-                contents = f.read()
-                if "[tool.poetry]" in contents:
-                    return "poetry"
-                elif "[tool.hatch]" in contents:
-                    return "hatch"
-                elif "[tool.flit]" in contents:
-                    return "flit"
-                else:
+            if contents is None:
+                if os.path.exists("requirements.txt"):
                     return "pip"
+                else:
+                    return None
+
+            # Prefer the parsed document; fall back to a plain text scan when no
+            # TOML parser is available or the file doesn't parse
+            tool = data.get("tool", {}) if data is not None else None
+            if tool is not None and not isinstance(tool, dict):
+                # e.g. `tool = 1` is valid TOML but declares no tool tables
+                tool = {}
+            for name in ("poetry", "hatch", "flit"):
+                if tool is not None:
+                    if name in tool:
+                        return name
+                elif f"[tool.{name}]" in contents:
+                    return name
+            return "pip"
         except Exception:
             return None
-        return None
 
     def _convert_requirements_to_poetry(self) -> str:
-        deps = []
-        if os.path.exists("requirements.txt"):
-            with open("requirements.txt", "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        deps.append(line)
-        return "\n".join([f"{dep}" for dep in deps])
+        try:
+            text = Path("requirements.txt").read_text()
+        except FileNotFoundError:
+            return ""
+        # Every non-blank, non-comment line, stripped, indented for the toml block
+        deps = re.findall(r'^[ \t]*([^#\s].*?)[ \t]*$', text, re.MULTILINE)
+        return "    " + "\n    ".join(deps) if deps else ""
 
     def _create_pyproject_toml(self):
-        if os.path.exists("pyproject.toml"):
+        if _read_pyproject() is not None:
             print_success("pyproject.toml already exists.")
             return
 
@@ -1547,14 +1784,13 @@ class ProjectSetup:
         self._package_name = self._get_default_package_name()
         package_name_input = input(f"Package name (default: {self._package_name}): ")
         if package_name_input:
-            self._package_name = (
-                package_name_input.replace(" ", "-").lower().replace("-", "_")
-            )
+            self._package_name = package_name_input.translate(_PACKAGE_NAME_TRANS).lower()
 
         package_version = input("Package version (default: 0.1.0): ") or "0.1.0"
         package_description = input("Package description: ")
-        author_name = self._get_git_config("user.name") or "unnamed developer"
-        author_email = self._get_git_config("user.email") or "developer@example.com"
+        git_config = _git_config_all()
+        author_name = git_config.get("user.name") or "unnamed developer"
+        author_email = git_config.get("user.email") or "developer@example.com"
 
         author_name = input(f"Author name (default: {author_name}): ") or author_name
         author_email = (
@@ -1568,95 +1804,38 @@ class ProjectSetup:
 
         if self._use_poetry:
             deps_block = self._convert_requirements_to_poetry()
-            content = f"""
-                [tool.poetry]
-                name = "{self._package_name}"
-                version = "{package_version}"
-                description = "{package_description}"
-                authors = ["{author_name} <{author_email}>"]
-
-                [tool.poetry.dependencies]
-                python = "^3.8"
-{self._indent_dependencies(deps_block)}
-
-                [tool.poetry.group.dev.dependencies]
-                pytest = "^7.0"
-
-                [build-system]
-                requires = ["poetry-core>=1.0.0"]
-                build-backend = "poetry.core.masonry.api"
-            """
+            content = _POETRY_PYPROJECT_TEMPLATE.substitute(
+                name=self._package_name,
+                version=package_version,
+                description=package_description,
+                author_name=author_name,
+                author_email=author_email,
+                dependencies=f"\n{deps_block}" if deps_block else "",
+            )
         else:
             build_system = input("Build system (default: hatchling): ") or "hatchling"
-            content = f"""
-                [project]
-                name = "{self._package_name}"
-                version = "{package_version}"
-                description = "{package_description}"
-                authors = [{{name="{author_name}", email="{author_email}"}}]
-                requires-python = ">=3.8"
-
-                [tool.pytest.ini_options]
-                pythonpath = ["src"]
-                testpaths = ["tests", "src"]
-                markers = [
-                    "integration: marks tests as integration (deselect with '-m \\"not integration\\"')"
-                ]
-                addopts = "-m 'not integration'"
-
-                [build-system]
-                requires = ["{build_system}"]
-                build-backend = "{build_system}.build"
-
-                [tool.hatch.build.targets.wheel]
-                packages = ["src/{self._package_name}"]
-
-                [tool.hatch.build.targets.sdist]
-                exclude = [
-                    ".unittest/",
-                    ".venv/",
-                    "tests/",
-                    "samples/",
-                    "docs/",
-                    ".git/",
-                    ".gitignore",
-                    ".vscode/",
-                    "*.pyc",
-                    "__pycache__/",
-                    "*.egg-info/",
-                    "dist/",
-                    "build/"
-                ]
-            """
+            content = _PROJECT_PYPROJECT_TEMPLATE.substitute(
+                name=self._package_name,
+                version=package_version,
+                description=package_description,
+                author_name=author_name,
+                author_email=author_email,
+                build_system=build_system,
+            )
             os.makedirs("tests", exist_ok=True)
 
-        with open("pyproject.toml", "w", encoding="utf-8") as file:
-            file.write(self._strip_content(content))
+        Path("pyproject.toml").write_text(content, encoding="utf-8")
+        _read_pyproject.cache_clear()
+        _parse_pyproject.cache_clear()
         print_success("pyproject.toml created.")
 
-    def _indent_dependencies(self, deps: str) -> str:
-        return "\n".join([" " * 4 + dep for dep in deps.splitlines() if dep.strip()])
-
     def _get_default_package_name(self):
-        return Path(os.getcwd()).name.lower().replace(" ", "_").replace("-", "_")
-
-    def _get_git_config(self, key: str) -> str:
-        try:
-            result = subprocess.run(
-                ["git", "config", "--get", key], capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            return None
-        return None
+        return Path(os.getcwd()).name.translate(_PACKAGE_NAME_TRANS).lower()
 
     def _strip_content(self, content: str) -> str:
-        return "\n".join(
-            line.strip().replace("\t", "")
-            for line in content.split("\n")
-            if line.strip()
-        )
+        # Drop every tab, then collapse each whitespace run around a newline
+        # (trailing/leading spaces and blank lines) into a single newline
+        return _LINE_BREAK_RE.sub("\n", content.replace("\t", "")).strip()
 
     def _setup_requirements(self):
         self._write_if_missing("requirements.txt", "# project requirements")
@@ -1666,13 +1845,18 @@ class ProjectSetup:
         )
 
     def _write_if_missing(self, filename: str, content: str):
-        if not os.path.exists(filename):
-            print_info(f"{filename} not found. Let's create one.")
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(content)
-            print_success(f"{filename} created.")
-        else:
+        # Mode "x" creates the file atomically and fails if it already exists
+        try:
+            f = open(filename, "x", encoding="utf-8")
+        except FileExistsError:
             print_success(f"{filename} already exists.")
+            return
+        print_info(f"{filename} not found. Let's create one.")
+        with f:
+            f.write(content)
+        # A new requirements file may need to show up in the cached listing
+        self._requirements_files = None
+        print_success(f"{filename} created.")
 
     def _dev_requirements_content(self) -> str:
         return """
@@ -2005,7 +2189,7 @@ class ProjectSetup:
                                         if _remove_directory(VENV):
                                             print_success(f"Removed {VENV}")
                                         print(f"🐍 Recreating venv with {new_python}...")
-                                        subprocess.run([new_python, "-m", "venv", VENV], check=True)
+                                        _create_venv(new_python)
                                         self._store_python_interpreter_path()
                                         # Update stored preference
                                         self.ca_settings["python_interpreter"] = new_python
@@ -2842,10 +3026,10 @@ break-system-packages = true
                 print(f"🗑️  Removing existing virtual environment at {VENV}...")
                 if _remove_directory(VENV):
                     print_success(f"Removed {VENV}")
-                subprocess.run([python_path, "-m", "venv", VENV], check=True)
+                _create_venv(python_path)
                 self._store_python_interpreter_path()
             elif not Path(VENV).exists():
-                subprocess.run([python_path, "-m", "venv", VENV], check=True)
+                _create_venv(python_path)
                 # After creating the venv, detect and store the actual Python path
                 self._store_python_interpreter_path()
             else:
@@ -2860,7 +3044,7 @@ break-system-packages = true
                             print(f"🗑️  Removing existing virtual environment at {VENV}...")
                             if _remove_directory(VENV):
                                 print_success(f"Removed {VENV}")
-                            subprocess.run([python_path, "-m", "venv", VENV], check=True)
+                            _create_venv(python_path)
                             self._store_python_interpreter_path()
                         else:
                             print_info(f"Keeping existing venv with Python {venv_version}")
@@ -2875,25 +3059,34 @@ break-system-packages = true
             # Create pip.conf with repository settings
             self._create_pip_conf()
             
-            # Upgrade pip with progress indication
-            self._run_pip_command_with_progress(
-                ["install", "--upgrade", "pip"],
-                "Upgrading pip"
-            )
+            # Upgrade pip with progress indication, unless the venv's pip is
+            # already recent enough and no upgrade was requested
+            pip_version = _get_venv_pip_version()
+            if env_preference == "upgrade" or pip_version is None or pip_version < MIN_PIP_VERSION:
+                self._run_pip_command_with_progress(
+                    ["install", "--upgrade", "pip"],
+                    "Upgrading pip"
+                )
+            else:
+                print_info(f"pip {'.'.join(map(str, pip_version))} is up to date, skipping upgrade")
 
             self._setup_requirements()
 
-            # Install from requirements files with progress indication
-            for req_file in self.get_list_of_requirements_files():
+            # Install from all requirements files in a single pip invocation so
+            # pip starts up and resolves the environment only once
+            req_files = self.get_list_of_requirements_files()
+            if req_files:
                 # Add --upgrade flag if preference is 'upgrade'
                 upgrade_flag = "--upgrade" if env_preference == "upgrade" else ""
-                pip_args = ["install", "-r", req_file]
+                pip_args = ["install"]
+                for req_file in req_files:
+                    pip_args.extend(["-r", req_file])
                 if upgrade_flag:
                     pip_args.append(upgrade_flag)
                     
                 self._run_pip_command_with_progress(
                     pip_args,
-                    f"Installing packages from {req_file}{' (with upgrade)' if upgrade_flag else ''}"
+                    f"Installing packages from {', '.join(req_files)}{' (with upgrade)' if upgrade_flag else ''}"
                 )
 
             # Install local package in editable mode with progress indication
@@ -2918,23 +3111,23 @@ break-system-packages = true
     def _setup_poetry(self):
         print("📚  Using Poetry for environment setup...")
         try:
-            # 1) Detect existing installation
-            if which("poetry") is not None:
-                result = subprocess.run(
-                    ["poetry", "--version"], capture_output=True, text=True, check=True
-                )
-                version = result.stdout.strip()
+            # 1) Detect existing installation; finding it on PATH is enough, so
+            #    skip the slow `poetry --version` startup here
+            poetry = which("poetry")
+            if poetry is not None:
                 self.__exit_notes.append(
-                    f"✅ Poetry already installed ({version}), skipping installer."
+                    f"✅ Poetry already installed ({poetry}), skipping installer."
                 )
             else:
-                # 2) Install Poetry
+                # 2) Install Poetry: download the installer ourselves and pipe it
+                #    straight into this interpreter instead of `curl | python3 -`
                 print("⬇️ Installing Poetry…")
-                subprocess.run(
-                    "curl -sSL https://install.python-poetry.org | python3 -",
-                    shell=True,
-                    check=True,
-                )
+                try:
+                    installer = fetch_url_with_retry("https://install.python-poetry.org")
+                except Exception as e:
+                    print(f"❌ Could not download the Poetry installer: {e}")
+                    sys.exit(1)
+                subprocess.run([sys.executable, "-"], input=installer, check=True)
 
                 # make it available right now
                 poetry_bin = os.path.expanduser("~/.local/bin")
@@ -2969,15 +3162,15 @@ break-system-packages = true
                         "🔄 Then reload your shell (e.g. exec $SHELL -l)."
                     )
 
-            # 4) Verify Poetry now exists
-            print("🔎  Verifying Poetry installation…")
-            result = subprocess.run(
-                ["poetry", "--version"], capture_output=True, text=True
-            )
-            if result.returncode != 0:
-                print(f"❌ Poetry installation failed:\n{result.stderr.strip()}")
-                sys.exit(1)
-            print(f"✅ {result.stdout.strip()}")
+                # 4) Verify the freshly installed Poetry works
+                print("🔎  Verifying Poetry installation…")
+                result = subprocess.run(
+                    ["poetry", "--version"], capture_output=True, text=True
+                )
+                if result.returncode != 0:
+                    print(f"❌ Poetry installation failed:\n{result.stderr.strip()}")
+                    sys.exit(1)
+                print(f"✅ {result.stdout.strip()}")
 
             # 5) Install project deps
             print("🔧 Creating virtual environment with Poetry...")
@@ -2988,22 +3181,26 @@ break-system-packages = true
             sys.exit(1)
 
     def get_list_of_requirements_files(self) -> List[str]:
-        return [
-            f
-            for f in os.listdir(Path(__file__).parent)
-            if f.startswith("requirements") and f.endswith(".txt")
-        ]
+        if self._requirements_files is not None:
+            return self._requirements_files
+
+        with os.scandir(Path(__file__).parent) as entries:
+            self._requirements_files = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith("requirements")
+                and entry.name.endswith(".txt")
+                and entry.is_file()
+            ]
+        return self._requirements_files
 
     def print_env_info(self):
         print_header("Python Environment Info")
-        print(f"📦 Python Version     : {platform.python_version()}")
+        print(f"📦 Python Version     : {_python_version()}")
         print(f"🐍 Python Executable  : {sys.executable}")
         print(f"📂 sys.prefix         : {sys.prefix}")
         print(f"📂 Base Prefix        : {getattr(sys, 'base_prefix', sys.prefix)}")
-        site_packages = (
-            site.getsitepackages()[0] if hasattr(site, "getsitepackages") else "N/A"
-        )
-        print(f"🧠 site-packages path : {site_packages}")
+        print(f"🧠 site-packages path : {_site_packages_path()}")
         in_venv = self.is_virtual_environment()
         print(f"✅ In Virtual Env     : {'Yes' if in_venv else 'No'}")
         if in_venv: